@@ -8,30 +8,100 @@ import os
 import sys
 import platform
 import argparse
+import atexit
 import subprocess
 import tempfile
 import shutil
+import contextlib
+import functools
+import itertools
+import socket
+import time
 from pathlib import Path
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging.handlers
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import threading
 
+# Number of files handed to a single LibreOffice invocation
+DEFAULT_BATCH_SIZE = 20
+
+# Seconds a single file may take to convert (5 minutes)
+CONVERSION_TIMEOUT = 300
+
+# Approximate memory used by one running LibreOffice conversion
+MEMORY_PER_WORKER = 500 * 1024 ** 2
+
+# Number of files queued on the executor before waiting for them to finish
+SUBMIT_WINDOW = 500
+
+# First bytes of a zip container such as .pptx (a real .ppt starts with D0 CF 11 E0)
+ZIP_MAGIC = b'PK\x03\x04'
+
+# Platform the script runs on, resolved once instead of for every file
+_PLATFORM = platform.system()
+
+# PowerPoint application shared by all Windows conversions (see get_powerpoint)
+_powerpoint = None
+_powerpoint_lock = threading.Lock()
+
+if _PLATFORM == "Windows":
+    # Make comtypes put the main thread in the multithreaded COM apartment, so the
+    # shared PowerPoint application can be used from worker threads too
+    sys.coinit_flags = 0  # COINIT_MULTITHREADED
+
+# Running LibreOffice UNO server as (process, desktop, profile_dir) (see start_soffice_server)
+_uno_server = None
+# LibreOffice does not load documents in parallel, so UNO conversions take turns
+_uno_lock = threading.Lock()
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 def setup_logging(verbose=False):
-    """Setup logging configuration"""
+    """
+    Setup logging configuration
+    
+    Records are put on a queue and written by a background listener thread,
+    so worker threads never wait for each other or for the console.
+    """
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener.start()
+    # Flush the remaining records on exit
+    atexit.register(listener.stop)
 
-# Thread-safe logging lock
-log_lock = threading.Lock()
+def setup_worker_logging(level):
+    """
+    Setup logging in a process pool worker
+    
+    Workers are spawned without the parent's queue listener, so they write
+    their records to the console directly.
+    
+    Args:
+        level (int): Logging level of the parent process
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
+@functools.lru_cache(maxsize=1)
 def find_libreoffice():
     """
     Find LibreOffice executable on macOS
     
+    The result is cached, since every conversion looks it up again.
+    
     Returns:
         str: Path to LibreOffice executable or None if not found
     """
@@ -69,6 +139,68 @@ def find_libreoffice():
     
     return None
 
+def get_mtime_ns(path):
+    """
+    Get the modification time of a file
+    
+    Args:
+        path (Path): Path to the file
+    
+    Returns:
+        int: Modification time in nanoseconds, or None if the file does not exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def run_soffice(cmd, timeout):
+    """
+    Run a soffice command and wait for it to finish
+    
+    The process is started without preexec_fn, cwd or a new session and with
+    close_fds=False, so CPython can launch it with posix_spawn (or vfork on
+    Python 3.10+ Linux) instead of fork+exec. File descriptors opened by Python
+    are non-inheritable by default, so nothing leaks into soffice. Each run
+    uses a private, temporary LibreOffice profile.
+    
+    Args:
+        cmd (list): Command line to run
+        timeout (int): Seconds to wait before killing soffice
+    
+    Returns:
+        subprocess.CompletedProcess: Return code and stderr (stdout is discarded)
+    
+    Raises:
+        subprocess.TimeoutExpired: If soffice did not finish in time
+    """
+    # LibreOffice runs one instance per profile: a second soffice on the same profile hands
+    # its files to the first one or exits without converting. Give every run its own profile.
+    profile_dir = tempfile.mkdtemp(prefix='soffice-profile-')
+    cmd = [cmd[0], f'-env:UserInstallation={Path(profile_dir).as_uri()}', *cmd[1:]]
+    
+    logging.debug(f"Running command: {' '.join(cmd)}")
+    
+    try:
+        # soffice prints a line per converted file on stdout; only stderr is used, to report failures
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            close_fds=False
+        ) as process:
+            try:
+                _, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+    finally:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+    
+    return subprocess.CompletedProcess(cmd, process.returncode, None, stderr)
+
 def convert_with_libreoffice(input_path, output_path=None):
     """
     Convert a .ppt file to .pptx using LibreOffice
@@ -86,49 +218,45 @@ def convert_with_libreoffice(input_path, output_path=None):
         logging.error("Or install via Homebrew: brew install --cask libreoffice")
         return False
     
-    input_path = Path(input_path)
-    
     # Generate output path if not provided
     if output_path is None:
         output_path = input_path.with_suffix('.pptx')
-    else:
-        output_path = Path(output_path)
     
-    # Create a temporary directory for LibreOffice output
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # LibreOffice names its output after the input file. Write straight into the output
+    # directory, unless that would overwrite an unrelated file of the same name there.
+    # The temporary directory is created inside the output directory, so the converted
+    # file is always renamed into place on the same filesystem.
+    out_dir = output_path.parent
+    use_temp_dir = output_path.name != f"{input_path.stem}.pptx" and (out_dir / f"{input_path.stem}.pptx").exists()
+    
+    with tempfile.TemporaryDirectory(dir=out_dir) if use_temp_dir else contextlib.nullcontext(str(out_dir)) as work_dir:
         try:
+            converted_output = Path(work_dir) / f"{input_path.stem}.pptx"
+            previous_mtime = get_mtime_ns(converted_output)
+            
             # LibreOffice command to convert
             cmd = [
                 soffice_path,
                 '--headless',
                 '--convert-to', 'pptx',
-                '--outdir', temp_dir,
-                str(input_path.absolute())
+                '--outdir', work_dir,
+                os.path.abspath(input_path)
             ]
             
-            logging.debug(f"Running command: {' '.join(cmd)}")
-            
             # Run LibreOffice conversion
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            result = run_soffice(cmd, timeout=CONVERSION_TIMEOUT)
             
             if result.returncode != 0:
                 logging.error(f"LibreOffice conversion failed: {result.stderr}")
                 return False
             
-            # Find the converted file in temp directory
-            temp_output = Path(temp_dir) / f"{input_path.stem}.pptx"
-            
-            if not temp_output.exists():
-                logging.error(f"Converted file not found in temp directory: {temp_output}")
+            # LibreOffice may exit successfully without writing the converted file
+            if get_mtime_ns(converted_output) in (None, previous_mtime):
+                logging.error(f"Converted file not found: {converted_output}")
                 return False
             
-            # Move the converted file to the desired output location
-            shutil.move(str(temp_output), str(output_path))
+            if converted_output != output_path:
+                os.replace(converted_output, output_path)
             
             logging.info(f"Successfully converted: {input_path} → {output_path}")
             return True
@@ -140,6 +268,329 @@ def convert_with_libreoffice(input_path, output_path=None):
             logging.error(f"Error converting {input_path}: {str(e)}")
             return False
 
+def convert_batch_with_libreoffice(input_paths, out_dir):
+    """
+    Convert several .ppt files to .pptx with a single LibreOffice invocation
+    
+    LibreOffice writes every converted file into out_dir as <name>.pptx, so
+    the input files must have distinct names.
+    
+    Args:
+        input_paths (list): Paths to the input .ppt files
+        out_dir (Path): Directory the converted files are written to
+    
+    Returns:
+        list: (success: bool, input_path: Path, output_path: Path, message: str) for each input file
+    """
+    soffice_path = find_libreoffice()
+    if not soffice_path:
+        message = "LibreOffice not found. Please install LibreOffice from https://www.libreoffice.org/"
+        return [(False, input_path, None, message) for input_path in input_paths]
+    
+    output_paths = [out_dir / f"{input_path.stem}.pptx" for input_path in input_paths]
+    previous_mtimes = [get_mtime_ns(output_path) for output_path in output_paths]
+    
+    # LibreOffice command to convert the whole batch
+    cmd = [
+        soffice_path,
+        '--headless',
+        '--convert-to', 'pptx',
+        '--outdir', str(out_dir),
+        *(os.path.abspath(input_path) for input_path in input_paths)
+    ]
+    
+    failure = None
+    try:
+        # Scale the timeout with the batch size, but never give less than a single file gets
+        result = run_soffice(cmd, timeout=max(CONVERSION_TIMEOUT, 60 + 15 * len(input_paths)))
+        if result.returncode != 0:
+            failure = f"LibreOffice conversion failed: {result.stderr}"
+    except subprocess.TimeoutExpired:
+        failure = "Conversion timed out"
+    except Exception as e:
+        failure = str(e)
+    
+    results = []
+    retry_paths = []
+    for input_path, output_path, previous_mtime in zip(input_paths, output_paths, previous_mtimes):
+        if get_mtime_ns(output_path) not in (None, previous_mtime):
+            results.append((True, input_path, output_path, f"Successfully converted: {input_path} → {output_path}"))
+        elif failure is None:
+            # LibreOffice skips files it cannot open without failing the whole run
+            results.append((False, input_path, output_path, f"Conversion failed: {input_path}"))
+        elif len(input_paths) == 1:
+            # The file already had a LibreOffice run to itself, retrying it would fail the same way
+            results.append((False, input_path, output_path, f"{failure} ({input_path})"))
+        else:
+            retry_paths.append((input_path, output_path))
+    
+    if retry_paths:
+        # One bad file must not fail the whole batch, so convert the rest one at a time
+        logging.warning(f"Batch conversion failed ({failure}), retrying {len(retry_paths)} file(s) one at a time")
+    
+    for input_path, output_path in retry_paths:
+        if convert_with_libreoffice(input_path, output_path):
+            results.append((True, input_path, output_path, f"Successfully converted: {input_path} → {output_path}"))
+        else:
+            results.append((False, input_path, output_path, f"Conversion failed: {input_path}"))
+    
+    return results
+
+def start_soffice_server(timeout=30):
+    """
+    Start a long-lived headless LibreOffice server and connect to it over UNO
+    
+    Requires the LibreOffice Python bindings (the uno module). While the server
+    is running, convert_batch converts files through it instead of launching
+    a new soffice process for every batch.
+    
+    Args:
+        timeout (int): Seconds to wait for the server to accept connections
+    
+    Returns:
+        tuple: (process, desktop, profile_dir) or None if the server could not be started
+    """
+    global _uno_server
+    
+    try:
+        import uno
+        from com.sun.star.connection import NoConnectException
+    except ImportError:
+        logging.debug("LibreOffice Python bindings (uno) not available, converting with soffice batches")
+        return None
+    
+    soffice_path = find_libreoffice()
+    if not soffice_path:
+        return None
+    
+    # Pick a free local port for the server
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    
+    # Use a private profile so an already running LibreOffice does not take over the server
+    profile_dir = tempfile.mkdtemp(prefix='soffice-profile-')
+    connection = f"socket,host=127.0.0.1,port={port};urp;"
+    
+    cmd = [
+        soffice_path,
+        '--headless',
+        '--nologo',
+        '--nofirststartupwizard',
+        '--norestore',
+        f'-env:UserInstallation={Path(profile_dir).as_uri()}',
+        f'--accept={connection}'
+    ]
+    
+    logging.debug(f"Starting LibreOffice server: {' '.join(cmd)}")
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+    except OSError as e:
+        logging.warning(f"Could not start LibreOffice server ({str(e)}), converting with soffice batches")
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        return None
+    
+    try:
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        
+        # Wait until the server accepts connections
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}StarOffice.ComponentContext")
+                break
+            except NoConnectException:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.5)
+        
+        desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+    except Exception as e:
+        logging.warning(f"Could not connect to LibreOffice server ({str(e)}), converting with soffice batches")
+        stop_soffice_server((process, None, profile_dir))
+        return None
+    
+    _uno_server = (process, desktop, profile_dir)
+    
+    logging.info(f"Started LibreOffice server on port {port}")
+    return _uno_server
+
+def stop_soffice_server(server):
+    """
+    Shut down a LibreOffice server started by start_soffice_server
+    
+    Args:
+        server (tuple): (process, desktop, profile_dir) as returned by start_soffice_server
+    """
+    global _uno_server
+    
+    process, desktop, profile_dir = server
+    _uno_server = None
+    
+    if desktop is not None:
+        try:
+            desktop.terminate()
+        except Exception:
+            # The bridge is disposed while LibreOffice shuts down
+            pass
+    else:
+        # Never connected, so LibreOffice cannot be asked to shut down
+        process.terminate()
+    
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+def convert_with_uno(desktop, input_path, output_path=None):
+    """
+    Convert a .ppt file to .pptx through a running LibreOffice UNO server
+    
+    Args:
+        desktop: LibreOffice Desktop returned by start_soffice_server
+        input_path (Path): Path to the input .ppt file
+        output_path (Path): Path for the output .pptx file (optional)
+    
+    Returns:
+        bool: True if conversion successful, False otherwise
+    
+    Raises:
+        com.sun.star.uno.RuntimeException: If the connection to the server was lost
+    """
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.uno import RuntimeException as UnoRuntimeException
+    
+    # Generate output path if not provided
+    if output_path is None:
+        output_path = input_path.with_suffix('.pptx')
+    
+    try:
+        document = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(input_path)),
+            "_blank",
+            0,
+            (PropertyValue("Hidden", 0, True, 0),)
+        )
+        
+        if document is None:
+            logging.error(f"LibreOffice could not open file: {input_path}")
+            return False
+        
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                (
+                    PropertyValue("FilterName", 0, "Impress MS PowerPoint 2007 XML", 0),
+                    PropertyValue("Overwrite", 0, True, 0),
+                )
+            )
+        finally:
+            document.close(True)
+        
+        return True
+        
+    except UnoRuntimeException:
+        # The server crashed or was killed, the caller has to stop using it
+        raise
+    except Exception as e:
+        logging.error(f"Error converting {input_path}: {str(e)}")
+        return False
+
+def convert_batch_with_uno(input_paths):
+    """
+    Convert .ppt files one by one through the running LibreOffice UNO server
+    
+    Each document gets CONVERSION_TIMEOUT seconds; a watchdog kills the server
+    when a document hangs. When the server fails it is stopped, and the files
+    not yet converted are left for soffice.
+    
+    Args:
+        input_paths (list): Paths to the input .ppt files
+    
+    Returns:
+        list: (success: bool, input_path: Path, output_path: Path, message: str) for the leading
+        input files that were handled before the server stopped (all of them if it kept running)
+    """
+    results = []
+    for input_path in input_paths:
+        output_path = input_path.with_suffix('.pptx')
+        
+        with _uno_lock:
+            server = _uno_server
+            if server is None:
+                break
+            
+            process, desktop, _ = server
+            
+            # A hanging document blocks the call; killing the server makes it fail
+            watchdog = threading.Timer(CONVERSION_TIMEOUT, process.kill)
+            watchdog.start()
+            try:
+                success = convert_with_uno(desktop, input_path, output_path)
+            except Exception as e:
+                logging.warning(f"LibreOffice server failed ({str(e)}), converting with soffice batches")
+                stop_soffice_server(server)
+                break
+            finally:
+                watchdog.cancel()
+        
+        if success:
+            results.append((True, input_path, output_path, f"Successfully converted: {input_path} → {output_path}"))
+        else:
+            results.append((False, input_path, output_path, f"Conversion failed: {input_path}"))
+    
+    return results
+
+def get_powerpoint():
+    """
+    Get the PowerPoint application shared by all Windows conversions
+    
+    PowerPoint is started on first use and quit when the script exits, since
+    starting it takes seconds and starting it repeatedly makes COM calls fail
+    with "Call was rejected by callee". It is only restarted after a failed
+    conversion. Callers must hold _powerpoint_lock.
+    
+    Returns:
+        PowerPoint Application COM object
+    """
+    global _powerpoint
+    
+    if _powerpoint is None:
+        import comtypes.client
+        
+        _powerpoint = comtypes.client.CreateObject("Powerpoint.Application", dynamic=False)
+        _powerpoint.DisplayAlerts = 1  # ppAlertsNone
+        
+        # Register once, even when PowerPoint is restarted after a failure
+        atexit.unregister(quit_powerpoint)
+        atexit.register(quit_powerpoint)
+    
+    return _powerpoint
+
+def quit_powerpoint():
+    """
+    Quit the shared PowerPoint application if it was started
+    """
+    global _powerpoint
+    
+    with _powerpoint_lock:
+        if _powerpoint is None:
+            return
+        
+        try:
+            _powerpoint.Quit()
+        except Exception as e:
+            logging.debug(f"Error quitting PowerPoint: {str(e)}")
+        finally:
+            _powerpoint = None
+
 def convert_with_comtypes(input_path, output_path=None):
     """
     Convert a .ppt file to .pptx using comtypes (Windows only)
@@ -152,49 +603,114 @@ def convert_with_comtypes(input_path, output_path=None):
         bool: True if conversion successful, False otherwise
     """
     try:
+        import comtypes
         import comtypes.client
     except ImportError:
         logging.error("comtypes is required for Windows PowerPoint conversion")
         logging.error("Install it with: pip install comtypes")
         return False
     
-    input_path = Path(input_path)
-    
     # Generate output path if not provided
     if output_path is None:
         output_path = input_path.with_suffix('.pptx')
-    else:
-        output_path = Path(output_path)
+    
+    # Worker threads join the multithreaded apartment the shared PowerPoint lives in
+    comtypes.CoInitializeEx(comtypes.COINIT_MULTITHREADED)
     
     try:
-        # Initialize PowerPoint application
-        logging.info(f"Converting {input_path} to {output_path}")
-        powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
-        powerpoint.Visible = 1  # Make PowerPoint visible (optional)
-        
-        # Open the .ppt file
-        presentation = powerpoint.Presentations.Open(str(input_path.absolute()))
-        
-        # Save as .pptx (format 24 is for .pptx)
-        presentation.SaveAs(str(output_path.absolute()), 24)
-        
-        # Close presentation and PowerPoint
-        presentation.Close()
-        powerpoint.Quit()
+        # PowerPoint handles one call at a time
+        with _powerpoint_lock:
+            logging.info(f"Converting {input_path} to {output_path}")
+            powerpoint = get_powerpoint()
+            
+            # Open the .ppt file without a window (PowerPoint does not allow hiding the application)
+            presentation = powerpoint.Presentations.Open(os.path.abspath(input_path), False, False, False)
+            
+            try:
+                # Save as .pptx (format 24 is for .pptx)
+                presentation.SaveAs(os.path.abspath(output_path), 24)
+            finally:
+                presentation.Close()
         
         logging.info(f"Successfully converted: {input_path} → {output_path}")
         return True
         
     except Exception as e:
         logging.error(f"Error converting {input_path}: {str(e)}")
-        try:
-            # Clean up PowerPoint if still running
-            powerpoint.Quit()
-        except:
-            pass
+        # PowerPoint may have crashed or been closed, so start a fresh instance for the next file
+        quit_powerpoint()
+        return False
+    finally:
+        comtypes.CoUninitialize()
+
+# Conversion method for the current platform (None if the platform is not supported)
+_CONVERT_FN = {
+    "Darwin": convert_with_libreoffice,  # macOS
+    "Linux": convert_with_libreoffice,
+    "Windows": convert_with_comtypes,
+}.get(_PLATFORM)
+
+def is_zip_container(path):
+    """
+    Check whether a file starts with the zip signature, i.e. is a .pptx file whatever its name
+    
+    Args:
+        path (Path): Path to the file
+    
+    Returns:
+        bool: True if the file is a zip container, False otherwise or if it cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+    except OSError:
+        return False
+
+def fast_path_convert(input_path, output_path):
+    """
+    Copy a .ppt file that is really a .pptx file instead of converting it
+    
+    Presentation libraries often contain .pptx files renamed to .ppt. These
+    start with the zip signature instead of the OLE signature of a real .ppt
+    file, and only need to be copied to the .pptx name.
+    
+    Args:
+        input_path (Path): Path to the input .ppt file
+        output_path (Path): Path for the output .pptx file
+    
+    Returns:
+        bool: True if the file was already a .pptx file and was copied, False if it needs converting
+    """
+    if not is_zip_container(input_path):
         return False
+    
+    shutil.copyfile(input_path, output_path)
+    return True
 
-def convert_single_file(input_path, output_path=None, replace_existing=True):
+def copy_pptx_files(input_paths):
+    """
+    Copy .ppt files that are known to be .pptx files to their .pptx names (thread-safe version)
+    
+    Args:
+        input_paths (list): Paths to the input .ppt files
+    
+    Returns:
+        list: (success: bool, input_path: Path, output_path: Path, message: str) for each input file
+    """
+    results = []
+    for input_path in input_paths:
+        output_path = input_path.with_suffix('.pptx')
+        try:
+            shutil.copyfile(input_path, output_path)
+        except OSError as e:
+            results.append((False, input_path, output_path, f"Error copying {input_path}: {str(e)}"))
+            continue
+        
+        results.append((True, input_path, output_path, f"Copied (already .pptx): {input_path} → {output_path}"))
+    
+    return results
+
+def convert_single_file(input_path, output_path=None, replace_existing=True, probe=True):
     """
     Convert a single .ppt file to .pptx format (thread-safe version)
     
@@ -202,12 +718,11 @@ def convert_single_file(input_path, output_path=None, replace_existing=True):
         input_path (Path): Path to the input .ppt file
         output_path (Path): Path for the output .pptx file (optional)
         replace_existing (bool): Whether to replace existing .pptx files
+        probe (bool): Whether to check for a .pptx file named .ppt first (see fast_path_convert)
     
     Returns:
         tuple: (success: bool, input_path: Path, output_path: Path, message: str)
     """
-    input_path = Path(input_path)
-    
     if not input_path.exists():
         return False, input_path, None, f"Input file not found: {input_path}"
     
@@ -217,8 +732,6 @@ def convert_single_file(input_path, output_path=None, replace_existing=True):
     # Generate output path if not provided
     if output_path is None:
         output_path = input_path.with_suffix('.pptx')
-    else:
-        output_path = Path(output_path)
     
     # Check if output file already exists and we're not replacing
     if output_path.exists() and not replace_existing:
@@ -226,21 +739,17 @@ def convert_single_file(input_path, output_path=None, replace_existing=True):
     
     # If output file exists and we're replacing, log that we're overwriting
     if output_path.exists() and replace_existing:
-        with log_lock:
-            logging.info(f"Replacing existing file: {output_path}")
+        logging.info(f"Replacing existing file: {output_path}")
     
-    # Choose conversion method based on platform
-    current_platform = platform.system()
+    if _CONVERT_FN is None:
+        return False, input_path, output_path, f"Unsupported platform: {_PLATFORM}"
     
     try:
-        if current_platform == "Darwin":  # macOS
-            success = convert_with_libreoffice(input_path, output_path)
-        elif current_platform == "Windows":
-            success = convert_with_comtypes(input_path, output_path)
-        elif current_platform == "Linux":
-            success = convert_with_libreoffice(input_path, output_path)
-        else:
-            return False, input_path, output_path, f"Unsupported platform: {current_platform}"
+        # A .ppt file that is really a .pptx file only needs copying
+        if probe and fast_path_convert(input_path, output_path):
+            return True, input_path, output_path, f"Copied (already .pptx): {input_path} → {output_path}"
+        
+        success = _CONVERT_FN(input_path, output_path)
         
         if success:
             return True, input_path, output_path, f"Successfully converted: {input_path} → {output_path}"
@@ -250,43 +759,93 @@ def convert_single_file(input_path, output_path=None, replace_existing=True):
     except Exception as e:
         return False, input_path, output_path, f"Error converting {input_path}: {str(e)}"
 
-def convert_ppt_to_pptx(input_path, output_path=None):
+def convert_batch(input_paths, replace_existing=True):
+    """
+    Convert a group of .ppt files from the same directory (thread-safe version)
+    
+    On macOS and Linux the group is converted through the LibreOffice server when
+    one is running, or else by a single soffice process, which avoids paying
+    the LibreOffice startup cost for every file. Files left over when the
+    server fails are converted by soffice.
+    
+    Args:
+        input_paths (list): Paths to the input .ppt files
+        replace_existing (bool): Whether to replace existing .pptx files
+    
+    Returns:
+        list: (success: bool, input_path: Path, output_path: Path, message: str) for each input file
+    """
+    if _CONVERT_FN is not convert_with_libreoffice:
+        # The directory walk already routed .pptx files named .ppt to copy tasks
+        return [convert_single_file(input_path, None, replace_existing, probe=False) for input_path in input_paths]
+    
+    results = convert_batch_with_uno(input_paths) if _uno_server is not None else []
+    
+    remaining = input_paths[len(results):]
+    if remaining:
+        # Batches never mix directories, so results are written next to their sources
+        results += convert_batch_with_libreoffice(remaining, remaining[0].parent)
+    
+    return results
+
+def batched(iterable, size):
+    """
+    Split an iterable into lists of at most size items (like itertools.batched in Python 3.12)
+    
+    Args:
+        iterable: Items to split
+        size (int): Maximum number of items per list
+    
+    Yields:
+        list: The next group of items
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+def memory_limited_workers(max_workers):
+    """
+    Cap the number of parallel workers by the currently available memory
+    
+    Every worker runs its own LibreOffice conversion, so running more workers
+    than fit in memory only causes swapping. Requires psutil; without it the
+    requested number of workers is used unchanged.
+    
+    Args:
+        max_workers (int): Requested number of parallel workers
+    
+    Returns:
+        int: Number of workers to use
+    """
+    try:
+        import psutil
+    except ImportError:
+        logging.debug("psutil not installed, not limiting workers by available memory")
+        return max_workers
+    
+    available = psutil.virtual_memory().available
+    return min(max_workers, max(1, int(available // MEMORY_PER_WORKER)))
+
+def convert_ppt_to_pptx(input_path, output_path=None, replace_existing=True):
     """
     Convert a single .ppt file to .pptx format using the appropriate method for the platform
     
+    Accepts plain strings; the other conversion functions expect Path objects.
+    
     Args:
         input_path (str): Path to the input .ppt file
         output_path (str): Path for the output .pptx file (optional)
+        replace_existing (bool): Whether to replace an existing .pptx file
     
     Returns:
         bool: True if conversion successful, False otherwise
     """
     input_path = Path(input_path)
-    
-    if not input_path.exists():
-        logging.error(f"Input file not found: {input_path}")
-        return False
-    
-    if input_path.suffix.lower() != '.ppt':
-        logging.error(f"Input file is not a .ppt file: {input_path}")
-        return False
-    
-    # Generate output path if not provided
-    if output_path is None:
-        output_path = input_path.with_suffix('.pptx')
-    else:
+    if output_path is not None:
         output_path = Path(output_path)
     
-    # Check if output file already exists
-    if output_path.exists():
-        logging.warning(f"Output file already exists: {output_path}")
-        response = input(f"Overwrite {output_path}? (y/N): ").strip().lower()
-        if response != 'y':
-            logging.info("Skipping conversion")
-            return False
-    
     # Use the thread-safe conversion function
-    success, _, _, message = convert_single_file(input_path, output_path, replace_existing=True)
+    success, _, _, message = convert_single_file(input_path, output_path, replace_existing)
     
     if success:
         logging.info(message)
@@ -295,22 +854,77 @@ def convert_ppt_to_pptx(input_path, output_path=None):
     
     return success
 
-def convert_directory(directory_path, recursive=False, dry_run=False, max_workers=10, replace_existing=True):
+def normalize_name(name):
+    """
+    Normalize a file name for comparison the way the platform's filesystem compares names
+    
+    Args:
+        name (str): File name
+    
+    Returns:
+        str: Lowercased name on macOS and Windows (case-insensitive filesystems), else the name unchanged
+    """
+    return name.lower() if _PLATFORM in ("Darwin", "Windows") else name
+
+def iter_ppt_files(root, recursive=False):
+    """
+    Find .ppt files in a directory without building the whole file list first
+    
+    Uses os.scandir, which reads the entry types together with the names, so
+    no extra stat call is needed per entry. The same listing tells which .ppt
+    files already have a .pptx version next to them. All files of one
+    directory are yielded before any of its subdirectories is visited.
+    
+    Args:
+        root (Path): Directory to search
+        recursive (bool): Whether to search subdirectories recursively
+    
+    Yields:
+        tuple: (ppt_file: Path, pptx_exists: bool) for the next .ppt file
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        ppt_entries = []
+        pptx_names = set()
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    # Case-sensitive where the filesystem is, like Path.glob(), so that
+                    # a.ppt and a.PPT never both convert to the same a.pptx
+                    elif normalize_name(entry.name).endswith('.ppt'):
+                        ppt_entries.append(entry)
+                    elif normalize_name(entry.name).endswith('.pptx'):
+                        pptx_names.add(normalize_name(entry.name))
+        except OSError as e:
+            logging.error(f"Cannot read directory {directory}: {str(e)}")
+            continue
+        
+        for entry in ppt_entries:
+            # Same name as Path.with_suffix('.pptx'), since the suffix is always 4 characters
+            yield Path(entry.path), normalize_name(f"{entry.name[:-4]}.pptx") in pptx_names
+
+def convert_directory(directory_path, recursive=False, dry_run=False, max_workers=None, replace_existing=True,
+                      batch_size=DEFAULT_BATCH_SIZE, use_processes=False):
     """
     Convert all .ppt files in a directory to .pptx format using parallel processing
     
     Args:
-        directory_path (str): Path to the directory containing .ppt files
+        directory_path (Path): Path to the directory containing .ppt files
         recursive (bool): Whether to search subdirectories recursively
         dry_run (bool): If True, only show what would be converted without actually converting
-        max_workers (int): Maximum number of parallel workers
+        max_workers (int): Maximum number of parallel workers (default: number of CPUs)
         replace_existing (bool): Whether to replace existing .pptx files
+        batch_size (int): Maximum number of files converted by a single LibreOffice invocation
+        use_processes (bool): Run batches in a process pool instead of a thread pool
     
     Returns:
         tuple: (successful_conversions, failed_conversions, skipped_files)
     """
-    directory_path = Path(directory_path)
-    
     if not directory_path.exists():
         logging.error(f"Directory not found: {directory_path}")
         return 0, 0, 0
@@ -319,77 +933,147 @@ def convert_directory(directory_path, recursive=False, dry_run=False, max_worker
         logging.error(f"Path is not a directory: {directory_path}")
         return 0, 0, 0
     
-    # Find all .ppt files
-    pattern = "**/*.ppt" if recursive else "*.ppt"
-    ppt_files = list(directory_path.glob(pattern))
-    
-    if not ppt_files:
-        logging.info(f"No .ppt files found in {directory_path}")
-        return 0, 0, 0
-    
-    logging.info(f"Found {len(ppt_files)} .ppt file(s) to convert")
-    
-    # Prepare files for conversion
-    files_to_convert = []
+    found = 0
     skipped = 0
     
-    for ppt_file in ppt_files:
-        output_file = ppt_file.with_suffix('.pptx')
+    def iter_files_to_convert():
+        """Yield the .ppt files that need converting while the directory is walked"""
+        nonlocal found, skipped
         
-        # Skip existing files if replace_existing is False
-        if output_file.exists() and not replace_existing:
-            with log_lock:
+        for ppt_file, pptx_exists in iter_ppt_files(directory_path, recursive):
+            found += 1
+            
+            # Skip existing files if replace_existing is False
+            if pptx_exists and not replace_existing:
                 logging.info(f"Skipping {ppt_file} - .pptx version already exists")
-            skipped += 1
-            continue
-        
-        if dry_run:
-            action = "replace" if output_file.exists() else "convert"
-            with log_lock:
-                logging.info(f"[DRY RUN] Would {action}: {ppt_file} → {output_file}")
-            continue
-        
-        files_to_convert.append((ppt_file, output_file))
+                skipped += 1
+                continue
+            
+            if dry_run:
+                action = "replace" if pptx_exists else "convert"
+                logging.info(f"[DRY RUN] Would {action}: {ppt_file} → {ppt_file.with_suffix('.pptx')}")
+                continue
+            
+            yield ppt_file
+    
+    convert = functools.partial(convert_batch, replace_existing=replace_existing)
+    
+    def iter_tasks():
+        """Split the files into (function, batch) tasks, copying .ppt files that are really .pptx files"""
+        # Files of one directory are walked together, so batches never mix directories
+        # and every batch has distinct output names
+        for _, directory_files in itertools.groupby(iter_files_to_convert(), key=lambda path: path.parent):
+            copies = []
+            conversions = []
+            
+            for ppt_file in directory_files:
+                if is_zip_container(ppt_file):
+                    copies.append(ppt_file)
+                    if len(copies) == batch_size:
+                        yield copy_pptx_files, copies
+                        copies = []
+                else:
+                    conversions.append(ppt_file)
+                    if len(conversions) == batch_size:
+                        yield convert, conversions
+                        conversions = []
+            
+            if copies:
+                yield copy_pptx_files, copies
+            if conversions:
+                yield convert, conversions
+    
+    tasks = iter_tasks()
+    
+    # Walk until the first task so nothing is started when there is nothing to convert
+    first_task = next(tasks, None)
+    
+    if found == 0:
+        logging.info(f"No .ppt files found in {directory_path}")
+        return 0, 0, 0
     
     if dry_run:
+        logging.info(f"Found {found} .ppt file(s)")
         return 0, 0, skipped
     
-    if not files_to_convert:
+    if first_task is None:
+        logging.info(f"Found {found} .ppt file(s)")
         logging.info("No files to convert")
         return 0, 0, skipped
     
-    logging.info(f"Converting {len(files_to_convert)} files using {max_workers} workers...")
+    tasks = itertools.chain([first_task], tasks)
+    
+    # Each LibreOffice conversion mostly keeps one core busy
+    if max_workers is None:
+        max_workers = os.cpu_count() or 4
+    
+    workers = memory_limited_workers(max_workers)
+    if _PLATFORM == "Windows":
+        # All conversions share one PowerPoint instance, which handles one file at a time
+        workers = 1
+    elif workers < max_workers:
+        logging.info(f"Limiting to {workers} workers based on available memory")
+    
+    logging.info(f"Converting .ppt files using {workers} workers...")
     
     successful = 0
     failed = 0
     
-    # Use ThreadPoolExecutor for parallel processing
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all conversion tasks
-        future_to_file = {
-            executor.submit(convert_single_file, input_path, output_path, replace_existing): (input_path, output_path)
-            for input_path, output_path in files_to_convert
-        }
-        
-        # Process completed tasks
-        for future in as_completed(future_to_file):
-            input_path, output_path = future_to_file[future]
-            try:
-                success, _, _, message = future.result()
-                
-                with log_lock:
-                    if success:
-                        logging.info(message)
-                        successful += 1
-                    else:
-                        logging.error(message)
-                        failed += 1
-                        
-            except Exception as e:
-                with log_lock:
-                    logging.error(f"Error processing {input_path}: {str(e)}")
-                failed += 1
+    # Keep one LibreOffice server alive for the whole run when the UNO bindings are available.
+    # It is started with the first conversion task, so runs that only copy files never start it.
+    # Worker processes cannot share its connection, so the process pool always uses soffice batches.
+    server = None
+    start_server = not use_processes and _CONVERT_FN is convert_with_libreoffice
+    
+    if use_processes:
+        # Spawn instead of fork: forking while the logging listener and other threads
+        # run can deadlock, and forked workers would log into the parent's queue
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=setup_worker_logging,
+            initargs=(logging.getLogger().getEffectiveLevel(),)
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
     
+    try:
+        # Overlap batches across cores
+        with executor:
+            # Submit batches in bounded windows so the queued futures stay small for huge directories
+            for window in batched(tasks, max(1, SUBMIT_WINDOW // batch_size)):
+                if start_server and any(function is convert for function, _ in window):
+                    server = start_soffice_server()
+                    start_server = False
+                
+                future_to_batch = {
+                    executor.submit(function, batch): batch
+                    for function, batch in window
+                }
+                
+                # Drain the window before queuing the next one
+                for future in as_completed(future_to_batch):
+                    batch = future_to_batch[future]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        for input_path in batch:
+                            logging.error(f"Error processing {input_path}: {str(e)}")
+                        failed += len(batch)
+                        continue
+                    
+                    for success, _, _, message in results:
+                        if success:
+                            logging.info(message)
+                            successful += 1
+                        else:
+                            logging.error(message)
+                            failed += 1
+    finally:
+        if server is not None:
+            stop_soffice_server(server)
+    
+    logging.info(f"Found {found} .ppt file(s)")
     return successful, failed, skipped
 
 def check_dependencies():
@@ -399,7 +1083,7 @@ def check_dependencies():
     Returns:
         bool: True if dependencies are available, False otherwise
     """
-    current_platform = platform.system()
+    current_platform = _PLATFORM
     
     if current_platform == "Darwin" or current_platform == "Linux":  # macOS or Linux
         soffice_path = find_libreoffice()
@@ -416,6 +1100,14 @@ def check_dependencies():
             return False
         else:
             logging.info(f"Found LibreOffice at: {soffice_path}")
+            
+            # soffice is launched without fork+exec only on Python 3.10+
+            if sys.version_info < (3, 10):
+                logging.warning("Python 3.10 or newer is recommended for fast soffice process startup")
+            logging.debug(
+                f"soffice spawn: posix_spawn={getattr(subprocess, '_USE_POSIX_SPAWN', False)}, "
+                f"vfork={getattr(subprocess, '_USE_VFORK', False)}"
+            )
             return True
     
     elif current_platform == "Windows":
@@ -443,14 +1135,18 @@ Examples:
   %(prog)s /path/to/file.ppt               # Convert a single file
   %(prog)s /path/to/presentations/ --dry-run  # Show what would be converted
   %(prog)s /path/to/presentations/ -w 5    # Use 5 parallel workers
+  %(prog)s /path/to/presentations/ -b 50   # Convert 50 files per LibreOffice run
+  %(prog)s /path/to/presentations/ --process-pool  # Use worker processes instead of threads
   %(prog)s /path/to/presentations/ --no-replace  # Skip existing .pptx files
   %(prog)s --check-deps                    # Check if dependencies are installed
 
 Behavior:
   - By default, replaces existing .pptx files with fresh conversions
-  - Use --no-replace to skip files that already have .pptx versions
-  - Uses 10 parallel workers by default for directory conversion
-  - Adjust with -w/--workers option based on your system resources
+  - Use --no-replace to skip files that already have .pptx versions (also for single files)
+  - Uses one parallel worker per CPU by default for directory conversion
+  - On macOS/Linux, converts up to 20 files per LibreOffice run (-b/--batch-size)
+  - Adjust with -w/--workers option based on your system resources (Windows always uses 1)
+  - Workers are capped by available memory (~500 MB each) when psutil is installed
 
 Platform Support:
   macOS/Linux: Uses LibreOffice (install from https://www.libreoffice.org/)
@@ -496,8 +1192,22 @@ Platform Support:
     parser.add_argument(
         "-w", "--workers",
         type=int,
-        default=10,
-        help="Number of parallel workers for directory conversion (default: 10)"
+        default=None,
+        help="Number of parallel workers for directory conversion "
+             "(default: number of CPUs, capped by available memory when psutil is installed)"
+    )
+    
+    parser.add_argument(
+        "-b", "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Number of files converted by a single LibreOffice run (default: {DEFAULT_BATCH_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--process-pool",
+        action="store_true",
+        help="Run conversions in worker processes instead of threads"
     )
     
     parser.add_argument(
@@ -522,6 +1232,9 @@ Platform Support:
     if not args.path:
         parser.error("Path argument is required unless using --check-deps")
     
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    
     # Check dependencies before proceeding
     if not check_dependencies():
         sys.exit(1)
@@ -538,13 +1251,13 @@ Platform Support:
             logging.error("File must have .ppt extension")
             sys.exit(1)
         
-        output_path = args.output if args.output else None
+        output_path = Path(args.output) if args.output else None
         
         if args.dry_run:
             output_display = output_path or path.with_suffix('.pptx')
             logging.info(f"[DRY RUN] Would convert: {path} → {output_display}")
         else:
-            success = convert_ppt_to_pptx(path, output_path)
+            success = convert_ppt_to_pptx(path, output_path, replace_existing=not args.no_replace)
             sys.exit(0 if success else 1)
     
     elif path.is_dir():
@@ -554,7 +1267,9 @@ Platform Support:
             recursive=args.recursive,
             dry_run=args.dry_run,
             max_workers=args.workers,
-            replace_existing=not args.no_replace
+            replace_existing=not args.no_replace,
+            batch_size=args.batch_size,
+            use_processes=args.process_pool
         )
         
         if not args.dry_run: